@@ -1,5 +1,9 @@
 import os
-import re
+import heapq
+import pickle
+import io
+from html import escape
+from concurrent.futures import ThreadPoolExecutor
 
 #List of supported distros
 DISTROS = ["Ubuntu", "Fedora"]
@@ -7,60 +11,140 @@ DISTROS = ["Ubuntu", "Fedora"]
 #Base folder where gadget files are organized
 BASE_DIR = "Gadgets"
 
-#Function to determine what architechtures and versions are present based on text files
-#present in local directory
-# Function to determine what architectures, versions, and distro versions
-# exist based on filename patterns.
-def extract_options_from_files():
-    distro_data = {}
+#Gadget filename format: glibc_<glibcVersion>_<distroVersion>_<arch>.txt
+FILENAME_PREFIX = "glibc_"
+FILENAME_SUFFIX = ".txt"
+
+#Scan results from the last run, keyed by architecture folder path
+CACHE_FILE = ".gadgets_cache.pkl"
+
+#Function to load the scan results saved by the last run
+#Returns an empty cache if there is no usable cache file, and drops any entry
+#that isn't shaped like (mtime_ns, glibc versions, distro versions) so that
+#folder just gets rescanned
+def load_scan_cache():
+    # It's only a cache, so any failure to read it (missing, truncated, written
+    # by an older version of this script...) just means scanning everything again
+    try:
+        with open(CACHE_FILE, 'rb') as f:
+            cache = pickle.load(f)
+    except Exception:
+        return {}
+
+    if not isinstance(cache, dict):
+        return {}
+
+    return {
+        arch_path: entry for arch_path, entry in cache.items()
+        if isinstance(entry, tuple) and len(entry) == 3
+        and isinstance(entry[1], dict) and isinstance(entry[2], dict)
+    }
+
+#Function to save the scan results for the next run
+def save_scan_cache(cache):
+    # Write to a temp file first so an interrupted run can't leave a broken cache
+    tmp_path = CACHE_FILE + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        pickle.dump(cache, f)
+    os.replace(tmp_path, CACHE_FILE)
+
+#Function to scan a single distro folder for the architectures and versions
+#present in its gadget filenames. Architecture folders whose mtime matches the
+#cache are not read again (adding, removing or renaming a file changes the mtime).
+#Returns (distro, data, arch_cache), where data is None if nothing usable was found
+def scan_distro(distro, cache):
+    distro_path = os.path.join(BASE_DIR, distro)
+
+    if not os.path.isdir(distro_path):
+        return distro, None, {}
+
+    # Architectures come from folder names, so there are only a handful.
+    # Versions repeat across every architecture, so dedupe them with dict keys
+    # (value is unused) and sort once at the end
+    architectures = set()
+    glibc_versions = {}
+    distro_versions = {}
 
-    # glibc_<glibcVersion>_<distroVersion>_<arch>.txt
-    pattern = re.compile(r"^glibc_([^_]+)_([^_]+)_([^_]+)\.txt$")
+    # arch_path -> (mtime_ns, glibc versions, distro versions)
+    arch_cache = {}
 
-    for distro in DISTROS:
-        distro_path = os.path.join(BASE_DIR, distro)
+    # os.walk is built on scandir; the layout is always
+    # <distro>/<arch>/<files>, so stop descending below the arch folders.
+    # Follow symlinked arch folders like the old os.path.isdir check did, otherwise
+    # they'd be listed as architectures without their files ever being read
+    for root, dirs, files in os.walk(distro_path, followlinks=True):
+        depth = root[len(distro_path):].count(os.sep)
 
-        if not os.path.isdir(distro_path):
+        if depth == 0:
+            architectures.update(dirs)
+
+            # Only walk into architecture folders that changed since the last run
+            stale_dirs = []
+            for arch in dirs:
+                arch_path = os.path.join(root, arch)
+                mtime = os.stat(arch_path).st_mtime_ns
+                cached = cache.get(arch_path)
+                if cached and cached[0] == mtime:
+                    arch_cache[arch_path] = cached
+                else:
+                    arch_cache[arch_path] = (mtime, {}, {})
+                    stale_dirs.append(arch)
+            dirs[:] = stale_dirs
             continue
 
-        architectures = set()
-        glibc_versions = set()
-        distro_versions = set()
+        dirs[:] = []
+        _mtime, arch_glibc_versions, arch_distro_versions = arch_cache[root]
 
-        for arch in os.listdir(distro_path):
-            arch_path = os.path.join(distro_path, arch)
-            if not os.path.isdir(arch_path):
+        for filename in files:
+            if not filename.startswith(FILENAME_PREFIX) or not filename.endswith(FILENAME_SUFFIX):
                 continue
 
-            architectures.add(arch)
+            # fixed shape filename, so a plain split is enough (no regex)
+            parts = filename[len(FILENAME_PREFIX):-len(FILENAME_SUFFIX)].split("_")
+            if len(parts) != 3 or not all(parts):
+                continue
 
-            for filename in os.listdir(arch_path):
-                m = pattern.match(filename)
-                if m:
-                    glibc_versions.add(m.group(1))
-                    distro_versions.add(m.group(2))
+            glibc_version, distro_version, _arch = parts
+            arch_glibc_versions[glibc_version] = None
+            arch_distro_versions[distro_version] = None
 
-        if architectures and glibc_versions and distro_versions:
-            distro_data[distro] = {
-                "architectures": sorted(architectures),
-                "glibc_versions": sorted(glibc_versions),
-                "distro_versions": sorted(distro_versions)
-            }
+    for _mtime, arch_glibc_versions, arch_distro_versions in arch_cache.values():
+        glibc_versions.update(dict.fromkeys(arch_glibc_versions))
+        distro_versions.update(dict.fromkeys(arch_distro_versions))
 
-    return distro_data
+    if not (architectures and glibc_versions and distro_versions):
+        return distro, None, arch_cache
 
+    return distro, {
+        "architectures": sorted(architectures),
+        "glibc_versions": sorted(glibc_versions),
+        "distro_versions": sorted(distro_versions)
+    }, arch_cache
 
+#Function to determine what architechtures and versions are present based on text files
+#present in local directory
+# Function to determine what architectures, versions, and distro versions
+# exist based on filename patterns.
+# Takes the cache from the previous run and returns (distro_data, new_cache)
+def extract_options_from_files(cache):
+    distro_data = {}
+    new_cache = {}
 
-#Function to generate new html for version/architectures to display in index.html 
-#based on source text files found in local directory
-# Function to generate new HTML using discovered distros, versions, and architectures
-def generate_html(distro_data):
-    # Combine all options across distros (so UI shows everything available)
-    all_arches = sorted({a for d in distro_data.values() for a in d["architectures"]})
-    all_glibc_versions = sorted({v for d in distro_data.values() for v in d["glibc_versions"]})
-    all_distro_versions = sorted({v for d in distro_data.values() for v in d["distro_versions"]})
+    # Each distro folder is independent and the scan is all directory I/O
+    # (which releases the GIL), so walk them in parallel.
+    # map() keeps results in DISTROS order
+    with ThreadPoolExecutor(max_workers=min(8, len(DISTROS))) as executor:
+        for distro, data, arch_cache in executor.map(scan_distro, DISTROS, [cache] * len(DISTROS)):
+            new_cache.update(arch_cache)
+            if data:
+                distro_data[distro] = data
 
-    html_template = f'''<!DOCTYPE html>
+    return distro_data, new_cache
+
+
+
+#Static pieces of index.html, the radio button options are written between them
+HTML_HEADER = '''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -73,27 +157,23 @@ def generate_html(distro_data):
         <h1>ROP Gadget Autocomplete</h1>
 
         <div class="options-container">
+'''
 
+HTML_GROUP_OPEN = '''
             <div class="option-group">
-                <h3>Distro</h3>
-                {"".join(f'<label><input type="radio" name="distro" value="{d}"> {d}</label><br>' for d in distro_data.keys())}
-            </div>
+                <h3>{title}</h3>
+                '''
 
-            <div class="option-group">
-                <h3>Distro Version</h3>
-                {"".join(f'<label><input type="radio" name="distrover" value="{dv}"> {dv}</label><br>' for dv in all_distro_versions)}
+HTML_GROUP_CLOSE = '''
             </div>
+'''
 
-            <div class="option-group">
-                <h3>Glibc Version</h3>
-                {"".join(f'<label><input type="radio" name="glibc" value="{gv}"> {gv}</label><br>' for gv in all_glibc_versions)}
-            </div>
-
-            <div class="option-group">
-                <h3>Architecture</h3>
-                {"".join(f'<label><input type="radio" name="arch" value="{a}"> {a}</label><br>' for a in all_arches)}
-            </div>
+#One radio button option, filled in with str.format. Options are one per line
+#at the same indentation as the group heading so the page is readable
+HTML_OPTION = '<label><input type="radio" name="{name}" value="{value}"> {value}</label><br>'
+HTML_OPTION_SEPARATOR = "\n                "
 
+HTML_FOOTER = '''
         </div>
 
         <div class="input-container">
@@ -106,14 +186,66 @@ def generate_html(distro_data):
 </body>
 </html>'''
 
-    with open('index.html', 'w') as f:
-        f.write(html_template)
+
+
+#Function to generate new html for version/architectures to display in index.html 
+#based on source text files found in local directory
+# Function to generate new HTML using discovered distros, versions, and architectures
+# Returns True if index.html was rewritten, False if it was already up to date
+def generate_html(distro_data):
+    # Combine all options across distros (so UI shows everything available)
+    # Each distro's lists are already sorted, so merge them and drop duplicates
+    # instead of building a set and sorting it again
+    all_arches = list(dict.fromkeys(heapq.merge(*(d["architectures"] for d in distro_data.values()))))
+    all_glibc_versions = list(dict.fromkeys(heapq.merge(*(d["glibc_versions"] for d in distro_data.values()))))
+    all_distro_versions = list(dict.fromkeys(heapq.merge(*(d["distro_versions"] for d in distro_data.values()))))
+
+    # Stream the page into an in-memory buffer instead of building one big string
+    # Values come from filenames, so escape them once here rather than trusting them
+    f = io.StringIO()
+    f.write(HTML_HEADER)
+
+    f.write(HTML_GROUP_OPEN.format(title="Distro"))
+    f.write(HTML_OPTION_SEPARATOR.join(HTML_OPTION.format(name="distro", value=escape(d)) for d in distro_data.keys()))
+    f.write(HTML_GROUP_CLOSE)
+
+    f.write(HTML_GROUP_OPEN.format(title="Distro Version"))
+    f.write(HTML_OPTION_SEPARATOR.join(HTML_OPTION.format(name="distrover", value=escape(dv)) for dv in all_distro_versions))
+    f.write(HTML_GROUP_CLOSE)
+
+    f.write(HTML_GROUP_OPEN.format(title="Glibc Version"))
+    f.write(HTML_OPTION_SEPARATOR.join(HTML_OPTION.format(name="glibc", value=escape(gv)) for gv in all_glibc_versions))
+    f.write(HTML_GROUP_CLOSE)
+
+    f.write(HTML_GROUP_OPEN.format(title="Architecture"))
+    f.write(HTML_OPTION_SEPARATOR.join(HTML_OPTION.format(name="arch", value=escape(a)) for a in all_arches))
+    f.write(HTML_GROUP_CLOSE)
+
+    f.write(HTML_FOOTER)
+    html_bytes = f.getvalue().encode('utf-8')
+
+    # Don't touch index.html if nothing changed, so its mtime stays put and
+    # anything watching the file isn't triggered for no reason
+    try:
+        with open('index.html', 'rb') as existing:
+            if existing.read() == html_bytes:
+                return False
+    except FileNotFoundError:
+        pass
+
+    with open('index.html', 'wb') as out:
+        out.write(html_bytes)
+    return True
 
 
 
 def main():
     #Get architectures and versions from source filenames present in local directory
-    distro_data = extract_options_from_files()
+    #(folders that haven't changed since the last run are taken from the cache)
+    cache = load_scan_cache()
+    distro_data, new_cache = extract_options_from_files(cache)
+    if new_cache != cache:
+        save_scan_cache(new_cache)
     
     if not distro_data:
         print("No valid architecture-version files found in directory.")
@@ -126,8 +258,10 @@ def main():
         print(f"[{distro}] Distro Versions: {', '.join(data['distro_versions'])}")
     
     # Generate the HTML file with the found options
-    generate_html(distro_data)
-    print("index.html has been updated with available options.")
+    if generate_html(distro_data):
+        print("index.html has been updated with available options.")
+    else:
+        print("index.html is already up to date.")
 
 if __name__ == "__main__":
     main()
@@ -12,9 +12,73 @@ import time
 import shutil
 import requests
 import subprocess
-from bs4 import BeautifulSoup
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from selectolax.lexbor import LexborHTMLParser
 from collections import defaultdict
-from urllib.parse import urljoin, urlparse, parse_qs, urlencode
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from urllib.parse import urljoin, urlparse
+
+# How many Koji pages we fetch at the same time. Kept small so we stay polite to the server
+FETCH_WORKERS = 8
+
+# Koji package listing for glibc, one page of PAGE_SIZE builds starting at build_start
+PACKAGE_PAGE_URL = "https://koji.fedoraproject.org/koji/packageinfo?buildStart={build_start}&packageID=57&buildOrder=-completion_time&tagOrder=name&tagStart=0#buildlist"
+PAGE_SIZE = 50
+
+# Safety stop in case Koji ever keeps returning glibc builds past the end of the list
+MAX_PAGES = 200
+
+# How many RPMs we download at the same time
+DOWNLOAD_WORKERS = 16
+
+# Most builds allowed anywhere in the download -> extract -> ropper pipeline at once.
+# Ropper is the slow stage, so without a cap every rpm/libc would pile up on disk
+# waiting for it. Twice the ropper workers keeps the next builds ready without that
+MAX_IN_FLIGHT = 2 * (os.cpu_count() or 1)
+
+# One session for every request to Koji so connections (and TLS sessions) are kept
+# alive and reused across page fetches and the parallel download workers,
+# instead of requests.get() doing a fresh handshake every time
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=Retry(total=3, backoff_factor=0.3)))
+
+# ARM 32 bit assembly didn't seem to be available on this repository, but 
+# if we find it, we should be able to add it later.
+TARGET_ARCHITECTURES = ['aarch64', 'i686', 'x86_64']
+
+# Regexes are compiled once here instead of on every call / every link
+
+# Matches glibc version strings with fc disttag, e.g. glibc-2.41-11.fc42
+GLIBC_BUILD_PATTERN = re.compile(r'glibc-(\d+\.\d+)-(\d+)\.(fc\d+)')
+
+# Build ID inside a buildinfo link
+BUILD_ID_PATTERN = re.compile(r'buildID=(\d+)')
+
+# Main glibc package rpm (not debuginfo or other subpackages) for one of our target
+# architectures, e.g. .../x86_64/glibc-2.41-11.fc42.x86_64.rpm
+# group 1 is the architecture folder, which must match the architecture in the filename
+MAIN_RPM_PATTERN = re.compile(rf"/({'|'.join(map(re.escape, TARGET_ARCHITECTURES))})/glibc-\d+\.\d+-\d+\.fc\d+\.\1\.rpm$")
+
+# Sequence of digits and dots that looks like a version number
+VERSION_PATTERN = re.compile(r'(\d+\.\d+(?:\.\d+)*)')
+
+# ropper LOAD and INFO lines that get stripped from the gadget files
+JUNK_LINE_PATTERN = re.compile(rb"\[LOAD\]|\[INFO\]", re.IGNORECASE)
+
+def keep_lowest_release(version_dict, key, entry):
+    """
+    Store entry under key unless version_dict already has a lower release for it
+    Args:
+        version_dict (dict): dictionary of glibc versions. Keys are tuples (version, disttag)
+        key (tuple): (version, disttag) of the build
+        entry (dict): build info with at least a 'release' number
+    """
+    # Keep only the lowest release number for each version-disttag combination
+    # (If we want to change this to highest release number, we can easily do so here)
+    if (key not in version_dict) or (entry['release'] < version_dict[key]['release']):
+        version_dict[key] = entry
 
 def scrape_glibc_versions_from_page(url, version_dict):
     """
@@ -29,23 +93,22 @@ def scrape_glibc_versions_from_page(url, version_dict):
 
     # Check connectivity
     try:
-        response = requests.get(url)
+        response = SESSION.get(url)
         response.raise_for_status()
     except requests.RequestException as e:
         print(f"Error fetching page {url}: {e}")
         return False
     
-    soup = BeautifulSoup(response.content, 'html.parser')
-    
-    # REGEX Pattern to match glibc version strings with fc disttag
-    pattern = re.compile(r'glibc-(\d+\.\d+)-(\d+)\.(fc\d+)')
+    # Koji serves UTF-8 and lexbor takes bytes directly, so skip requests decoding
+    # (and guessing the charset of) the body first
+    tree = LexborHTMLParser(response.content)
     
     glibc_found = False
     
     # Find all links that contain glibc version information
-    for link in soup.find_all('a', href=True):
-        link_text = link.get_text().strip()
-        match = pattern.match(link_text)
+    for link in tree.css('a[href]'):
+        link_text = link.text(strip=True)
+        match = GLIBC_BUILD_PATTERN.match(link_text)
         
         # If we have an 'fc' disttag link
         if match:
@@ -55,9 +118,9 @@ def scrape_glibc_versions_from_page(url, version_dict):
             disttag = match.group(3)  # e.g., "fc42"
             build_id = None
             
-            # Extract build ID from href
-            href = link['href']
-            build_match = re.search(r'buildID=(\d+)', href)
+            # Extract build ID from href (selectolax gives None for a bare <a href>)
+            href = link.attributes.get('href') or ''
+            build_match = BUILD_ID_PATTERN.search(href) if href else None
             if build_match:
                 build_id = build_match.group(1)
             
@@ -65,17 +128,12 @@ def scrape_glibc_versions_from_page(url, version_dict):
             # Note that the fc disttag represents a standard build 
             # (as opposed to the exprimental eln)
             if build_id and disttag.startswith('fc'):
-                key = (version, disttag)
-                
-                # Keep only the lowest release number for each version-disttag combination
-                # (If we want to change this to highest release number, we can easily do so here)
-                if (key not in version_dict) or (release < version_dict[key]['release']):
-                    version_dict[key] = {
-                        'release': release,
-                        'build_id': build_id,
-                        'full_name': link_text,
-                        'source_url': url
-                    }
+                keep_lowest_release(version_dict, (version, disttag), {
+                    'release': release,
+                    'build_id': build_id,
+                    'full_name': link_text,
+                    'source_url': url
+                })
     
     return glibc_found
 
@@ -87,87 +145,48 @@ def get_glibc_versions_all_pages(quiet = False):
     Returns:
         dict: dictionary containing all glibc versions to be downloaded. Keys are tuples (version, disttag)
     """
-    base_url = "https://koji.fedoraproject.org/koji/packageinfo?buildStart=0&packageID=57&buildOrder=-completion_time&tagOrder=name&tagStart=0#buildlist"
-    
     version_dict = {}
-    processed_urls = set()
-    current_url = base_url
     page_count = 0
+    build_start = 0
     
     if quiet == False:
         print("Starting to scrape glibc versions from all pages...")
     
-    # Use iterative approach - follow next page links until no more glibc content
-    while current_url and (current_url not in processed_urls):
-        page_count += 1
+    # Koji pages through builds with buildStart in steps of PAGE_SIZE, so rather than
+    # digging the next-page link out of each page, fetch FETCH_WORKERS pages at a time
+    # and stop at the first page with no glibc content
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+        while page_count < MAX_PAGES:
+            page_urls = [PACKAGE_PAGE_URL.format(build_start=build_start + i * PAGE_SIZE) for i in range(FETCH_WORKERS)]
+            build_start += FETCH_WORKERS * PAGE_SIZE
+
+            # Each page fills its own dict so the workers never touch the same one
+            page_dicts = [{} for _ in page_urls]
+            results = executor.map(scrape_glibc_versions_from_page, page_urls, page_dicts)
+
+            done = False
+            for page_url, page_dict, glibc_found in zip(page_urls, page_dicts, results):
+                page_count += 1
 
-        if quiet == False:
-            print(f"Scraping page {page_count}: {current_url}")
-        
-        processed_urls.add(current_url)
-        
-        # Scrape the current page
-        glibc_found = scrape_glibc_versions_from_page(current_url, version_dict)
-        
-        if not glibc_found:
-            if quiet == False:
-                print(f"No glibc links found on page {page_count}, stopping pagination.")
+                if quiet == False:
+                    print(f"Scraping page {page_count}: {page_url}")
 
-            # This maybe should be 'continue'... not sure, should double check behavior...
-            break
-        
-        # Find the next page URL
-        try:
-            response = requests.get(current_url)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            next_url = None
-            pagination_links = soup.find_all('a', href=True)
-            
-            for link in pagination_links:
-                link_text = link.get_text().strip()
-                href = link['href']
-                
-                # Look for next page indicators
-                if '>>>' in link_text or '>>' in link_text or 'Next' in link_text.lower():
-                    next_url = urljoin(current_url, href)
+                if not glibc_found:
+                    if quiet == False:
+                        print(f"No glibc links found on page {page_count}, stopping pagination.")
+
+                    # This maybe should be 'continue'... not sure, should double check behavior...
+                    done = True
                     break
-            
-            # If no explicit next link found, try to construct next page URL
-            if not next_url:
-                parsed_url = urlparse(current_url)
-                query_params = parse_qs(parsed_url.query)
-                
-                if 'buildStart' in query_params:
-                    current_start = int(query_params['buildStart'][0])
-                    next_start = current_start + 50
-                    
-                    # Update buildStart parameter
-                    query_params['buildStart'] = [str(next_start)]
-                    
-                    # Reconstruct URL
-                    new_query = urlencode(query_params, doseq=True)
-                    next_url = f"{parsed_url.scheme}://{parsed_url.netloc}{parsed_url.path}?{new_query}{parsed_url.fragment}"
-                else:
-                    # If no buildStart parameter, we're probably on the first page
-                    next_url = base_url.replace('buildStart=0', 'buildStart=50')
-            
-            # Avoid infinite loop by checking if we've seen this URL before
-            if next_url in processed_urls:
-                if quiet == False:
-                    print("Next URL already processed, stopping pagination.")
+
+                for key, entry in page_dict.items():
+                    keep_lowest_release(version_dict, key, entry)
+
+            if done:
                 break
-                
-            current_url = next_url
-            
+
             # Small delay to be respectful to the server
             time.sleep(0.5)
-            
-        except requests.RequestException as e:
-            if quiet == False:
-                print(f"Error fetching next page: {e}")
-            break
     
     print(f"Scraped {page_count} pages total.")
     return version_dict
@@ -181,41 +200,50 @@ def extract_rpm_urls_from_buildinfo(buildinfo_url):
         dict: dictionary with string keys representing the architecture and values representing the .rpm download urls
     """
 
-    # ARM 32 bit assembly didn't seem to be available on this repository, but 
-    # if we find it, we should be able to add it later.
-    target_architectures = ['aarch64', 'i686', 'x86_64']
     rpm_urls = {}
     
     # Check connectivity
     try:
-        response = requests.get(buildinfo_url)
+        response = SESSION.get(buildinfo_url)
         response.raise_for_status()
     except requests.RequestException as e:
         print(f"Error fetching buildinfo page {buildinfo_url}: {e}")
         return rpm_urls
     
-    soup = BeautifulSoup(response.content, 'html.parser')
+    # Raw bytes, same as scrape_glibc_versions_from_page
+    tree = LexborHTMLParser(response.content)
     
     # Look for all RPM download links
-    for link in soup.find_all('a', href=True):
-        href = link['href']
+    for link in tree.css('a[href]'):
+        # selectolax gives None for a bare <a href>, skip those
+        href = link.attributes.get('href') or ''
+        if not href:
+            continue
         
-        # Check if this is an RPM download link for glibc (not debuginfo or other packages)
-        if (href.endswith('.rpm') and 
-            'glibc-' in href and 
-            not any(exclude in href for exclude in ['debuginfo', 'debugsource', 'devel', 'headers', 'static', 'utils'])):
-            
-            # Check if it's for one of our target architectures
-            for arch in target_architectures:
-                # Look for architecture in the URL path
-                if f'/{arch}/' in href and arch not in rpm_urls:
-                    # Make sure it's the main glibc package, not subpackages
-                    if re.search(rf'glibc-\d+\.\d+-\d+\.fc\d+\.{arch}\.rpm', href):
-                        rpm_urls[arch] = href
-                        break
+        # Check if this is the main glibc RPM for one of our target architectures
+        # (one regex instead of a pile of substring checks per link)
+        match = MAIN_RPM_PATTERN.search(href)
+        if match and match.group(1) not in rpm_urls:
+            rpm_urls[match.group(1)] = href
     
     return rpm_urls
 
+def fetch_rpm_urls_from_buildinfo(buildinfo_url):
+    """
+    Worker used by generate_download_urls: extract the RPM URLs from one buildinfo page,
+    then pause briefly so the parallel workers don't hammer the server
+    Args:
+        buildinfo_url (string): url for buildinfo page where the rpm download links are located
+    Returns:
+        dict: dictionary with string keys representing the architecture and values representing the .rpm download urls
+    """
+    rpm_urls = extract_rpm_urls_from_buildinfo(buildinfo_url)
+
+    # Small delay to be respectful to the server
+    time.sleep(0.3)
+
+    return rpm_urls
+
 def generate_download_urls(version_dict, quiet = False):
     """
     Generate actual download URLs from the version dictionary
@@ -234,38 +262,37 @@ def generate_download_urls(version_dict, quiet = False):
 
     total_builds = len(version_dict)
     current_build = 0
-    
-    # For each key in verson_dict
-    for (version, disttag), info in version_dict.items():
-        current_build += 1
-        build_id = info['build_id']
-        full_name = info['full_name']
-        
-        # Construct the buildinfo URL
-        # These are the actual links where the .rpm builds can be found
-        buildinfo_url = urljoin(base_url, f"buildinfo?buildID={build_id}")
-        
-        if quiet == False:
-            print(f"Processing build {current_build}/{total_builds}: {full_name}")
-        
-        # Extract RPM URLs from the buildinfo page
-        # This will be a dict with keys that are architechture strings
+
+    # Construct the buildinfo URLs up front
+    # These are the actual links where the .rpm builds can be found
+    buildinfo_urls = [urljoin(base_url, f"buildinfo?buildID={info['build_id']}") for info in version_dict.values()]
+
+    # The buildinfo pages are independent of each other, so fetch a few at a time
+    # instead of waiting on each request in turn. map() hands results back in order
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+        # Each result will be a dict with keys that are architechture strings
         # and values that represent the rpm download URLs
-        rpm_urls = extract_rpm_urls_from_buildinfo(buildinfo_url)
-        
-        # Small delay to be respectful to the server
-        time.sleep(0.3)
-        
-        download_urls.append({
-            'version': version,
-            'disttag': disttag,
-            'release': info['release'],
-            'full_name': full_name,
-            'buildinfo_url': buildinfo_url,
-            'build_id': build_id,
-            'source_page': info.get('source_url', 'Unknown'),
-            'rpm_urls': rpm_urls
-        })
+        rpm_url_results = executor.map(fetch_rpm_urls_from_buildinfo, buildinfo_urls)
+
+        # For each key in verson_dict
+        for ((version, disttag), info), buildinfo_url, rpm_urls in zip(version_dict.items(), buildinfo_urls, rpm_url_results):
+            current_build += 1
+            build_id = info['build_id']
+            full_name = info['full_name']
+
+            if quiet == False:
+                print(f"Processing build {current_build}/{total_builds}: {full_name}")
+
+            download_urls.append({
+                'version': version,
+                'disttag': disttag,
+                'release': info['release'],
+                'full_name': full_name,
+                'buildinfo_url': buildinfo_url,
+                'build_id': build_id,
+                'source_page': info.get('source_url', 'Unknown'),
+                'rpm_urls': rpm_urls
+            })
     
     return download_urls
 
@@ -306,7 +333,7 @@ def fetch_rpm_urls_all_versions(quiet = False):
         print(f"\nFound {len(version_dict)} unique glibc version-disttag combinations across all pages")
     
     # Generate URLs including RPM download links
-    urls = generate_download_urls(version_dict)
+    urls = generate_download_urls(version_dict, quiet)
 
     # Note: the above is a list of dicts representing the rpm URLs to be downloaded
     # Each dict has the following structure
@@ -324,137 +351,116 @@ def fetch_rpm_urls_all_versions(quiet = False):
     
     # Sort by version and disttag
     urls.sort(key=lambda x: (x['version'], x['disttag']))
+
+    # In quiet mode the report below is never printed, so just flatten the URLs
+    if quiet:
+        return [rpm_url for item in urls for rpm_url in item['rpm_urls'].values()]
     
-    if quiet == False:
-        print("\n" + "=" * 120)
-        print("LOWEST RELEASE FOR EACH GLIBC VERSION WITH FC DISTTAG")
-        print("=" * 120)
+    print("\n" + "=" * 120)
+    print("LOWEST RELEASE FOR EACH GLIBC VERSION WITH FC DISTTAG")
+    print("=" * 120)
         
-    # Count architectures found
+    # Count architectures found, and collect the rpm URLs to be returned in the same pass
     arch_stats = defaultdict(int)
+    all_rpm_urls = []
     
     for item in urls:
-        if quiet == False:
-            print(f"\nVersion: {item['version']:<8} Disttag: {item['disttag']:<6} Release: {item['release']:<4}")
-            print(f"Full Name: {item['full_name']}")
-            print(f"Build Info: {item['buildinfo_url']}")
+        print(f"\nVersion: {item['version']:<8} Disttag: {item['disttag']:<6} Release: {item['release']:<4}")
+        print(f"Full Name: {item['full_name']}")
+        print(f"Build Info: {item['buildinfo_url']}")
             
         if item['rpm_urls']:
-            if quiet == False:
-                print("RPM Download URLs:")
+            print("RPM Download URLs:")
             for arch, rpm_url in item['rpm_urls'].items():
                 arch_stats[arch] += 1
-                if quiet == False:
-                    print(f"  {arch}: {rpm_url}")
+                all_rpm_urls.append(rpm_url)
+                print(f"  {arch}: {rpm_url}")
         else:
-            if quiet == False:
-                print("RPM Download URLs: No compatible RPMs found for target architectures")
+            print("RPM Download URLs: No compatible RPMs found for target architectures")
         
-        if quiet == False:
-            print("-" * 120)
+        print("-" * 120)
     
-    # Print summary statistics if necessary
-    if quiet == False:
-        print("\n" + "=" * 120)
-        print("SUMMARY STATISTICS")
-        print("=" * 120)
-        print(f"Total unique glibc versions: {len(urls)}")
-        for arch in ['aarch64', 'i686', 'x86_64']:
-            print(f"Builds with {arch} RPM: {arch_stats[arch]}/{len(urls)}")
+    # Print summary statistics
+    print("\n" + "=" * 120)
+    print("SUMMARY STATISTICS")
+    print("=" * 120)
+    print(f"Total unique glibc versions: {len(urls)}")
+    for arch in TARGET_ARCHITECTURES:
+        print(f"Builds with {arch} RPM: {arch_stats[arch]}/{len(urls)}")
         
-    # Generate a simple list of just the RPM URLs for scripting purposes
-    if quiet == False:
-        print("\n" + "=" * 120)
-        print("FLAT LIST OF ALL RPM URLs (for scripting use)")
-        print("=" * 120)
-
-    # Append rpm URLs to list of URLs to be returned
-    all_rpm_urls = []
-    for item in urls:
-        for arch, rpm_url in item['rpm_urls'].items():
-            all_rpm_urls.append(rpm_url)
-            if quiet == False:
-                print(rpm_url)
+    # Print a simple list of just the RPM URLs for scripting purposes
+    print("\n" + "=" * 120)
+    print("FLAT LIST OF ALL RPM URLs (for scripting use)")
+    print("=" * 120)
+    for rpm_url in all_rpm_urls:
+        print(rpm_url)
     
-    if quiet == False:
-        print(f"\nTotal RPM URLs found: {len(all_rpm_urls)}")
+    print(f"\nTotal RPM URLs found: {len(all_rpm_urls)}")
     
     return all_rpm_urls
     
-def download_rpms_all_version(quiet=False):
-    urls = fetch_rpm_urls_all_versions(quiet)
-    # Where we are downloading things (taken from Ubuntu script for consistency)
-    download_dir = '../GlibcDownloads/Fedora'
-    file_paths = []
-    count = 0
-    os.makedirs(download_dir, exist_ok=True)
-
-    for url in urls:
-        # Finding the name and path
-        file_path = urlparse(url).path
-        file_name = os.path.basename(file_path)
-        full_path = os.path.join(download_dir, file_name)
+def download_rpm(url, download_dir, quiet=False):
+    """
+    Download a single RPM into download_dir
+    Args:
+        url (string): .rpm download url
+        download_dir (string): directory the rpm should be saved into
+        quiet (bool): Should the program display additional stdout information or not?
+    Returns:
+        string: path to the downloaded rpm, or None if the download failed
+    """
+    # Finding the name and path
+    file_path = urlparse(url).path
+    file_name = os.path.basename(file_path)
+    full_path = os.path.join(download_dir, file_name)
+
+    # Left over from an earlier run, no need to fetch it again
+    if os.path.exists(full_path) and os.path.getsize(full_path) > 0:
         if quiet == False:
-            print(f"Downloading: {file_name}")
+            print(f"Skipping (already downloaded): {file_name}")
+        return full_path
+
+    if quiet == False:
+        print(f"Downloading: {file_name}")
+    try:
+        # Ubuntu group was using the requests library so I used this instead of the wget
+        # Download to a .part file first so an interrupted download is never mistaken
+        # for a finished one by the check above
+        part_path = full_path + ".part"
         try:
-            # Ubuntu group was using the requests library so I used this instead of the wget
-            with requests.get(url, stream=True) as r:
+            with SESSION.get(url, stream=True) as r:
                 r.raise_for_status()
-                with open(full_path, 'wb') as f:
-                    for chunk in r.iter_content(chunk_size=8192):
+                with open(part_path, 'wb') as f:
+                    # 64 KiB chunks, RPMs are several MB so small chunks just mean more Python loop overhead
+                    for chunk in r.iter_content(chunk_size=1 << 16):
                         f.write(chunk)
-            if quiet == False:
-                print(f"Successfully downloaded: {file_name}\n")
-            # The path to the rpm, formatted like this "../GlibcDownloads/Fedora/name.rpm"
-            file_paths.append(full_path)
-            count +=1
+            os.replace(part_path, full_path)
+        except BaseException:
+            # Don't leave the partial download lying around
+            try:
+                os.remove(part_path)
+            except OSError:
+                pass
+            raise
+        if quiet == False:
+            print(f"Successfully downloaded: {file_name}\n")
+        # The path to the rpm, formatted like this "../GlibcDownloads/Fedora/name.rpm"
+        return full_path
 
-        except requests.exceptions.RequestException as e:
-            if quiet == False:
-                print(f"Error downloading {file_name}: {e}")
+    except requests.exceptions.RequestException as e:
+        if quiet == False:
+            print(f"Error downloading {file_name}: {e}")
+        return None
 
-    print(f"Successfully downloaded {count} files")
-    # I return this to make extracting easier later
-    return file_paths
-        
 LIBC_PATHS = [ './usr/lib64/libc.so.6', './usr/lib/libc.so.6','./lib64/libc.so.6', './lib/libc.so.6' ]
 
-def copy_binary(source_path, destination_path):
-    """
-    Copy a binary file from source to destination using shutil.copy()
-    
-    Args:
-        source_path (str): Path to the source binary file
-        destination_path (str): Path where the binary should be copied
-
-    Returns:
-        bool: True if successful, False otherwise
-    """
-    try:
-        # Check if source file exists
-        if not os.path.exists(source_path):
-            print(f"Error: Source file '{source_path}' does not exist")
-            return False
-        
-        # Create destination directory if it doesn't exist
-        os.makedirs(os.path.dirname(destination_path), exist_ok=True)
-        
-        # Copy the file
-        shutil.copy(source_path, destination_path)
-        print(f"Successfully copied '{source_path}' to '{destination_path}'")
-        return True
-        
-    except Exception as e:
-        print(f"Error copying file: {e}")
-        return False
-
+# Cached since the same rpm filename can be looked up more than once
+@lru_cache(maxsize=512)
 def create_libc_filename(rpm_filename):
     """
     """
     # Match sequence of digits and dots that looks like a version number
-    version_pattern = r'(\d+\.\d+(?:\.\d+)*)'
-
-    match = re.search(version_pattern, rpm_filename)
+    match = VERSION_PATTERN.search(rpm_filename)
 
     if match:
         version = match.group(1)
@@ -464,98 +470,215 @@ def create_libc_filename(rpm_filename):
 
 def extract_with_rpm2cpio(rpm_file, output_dir="."):
     """
-    Extract using rpm2cpio and cpio commands via pipe
+    Extract the libc candidates from an rpm into output_dir using rpm2cpio and cpio commands via pipe
+    (the rpm payload is only decompressed once)
     Args:
         rpm_file (str): Path to the source rpm archive file
         output_dir (str): Path where the binary should be extracted
+    Returns:
+        str: path of the real libc binary inside output_dir, or None if not found
     """
+    # I've had to hard-code the possible paths to libc.so.6 here. Not ideal.
+    # Maybe we can come up with a search solution later on
+    libc_filename = create_libc_filename(rpm_file)
+    candidates = LIBC_PATHS + [f"./lib/{libc_filename}", f"./lib64/{libc_filename}"]
+
     try:
         # Create rpm2cpio -> cpio pipeline
         rpm2cpio = subprocess.Popen(['rpm2cpio', rpm_file], stdout=subprocess.PIPE)
-
-        # I've had to hard-code the possible paths to libc.so.6 here. Not ideal.
-        # Maybe we can come up with a search solution later on
         cpio = subprocess.Popen(
-            ['cpio', '-idmv', LIBC_PATHS[0], LIBC_PATHS[1], LIBC_PATHS[2], LIBC_PATHS[3], f"./lib/{create_libc_filename(rpm_file)}", f"./lib64/{create_libc_filename(rpm_file)}"],
+            ['cpio', '-idm'] + candidates,
             stdin=rpm2cpio.stdout,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             cwd=output_dir
         )
-        
+
         #Close rpm2cpio standard output
         rpm2cpio.stdout.close()
-        output, error = cpio.communicate()
-        
-        if cpio.returncode == 0:
-            print("Successfully extracted libc.so.6")
-            # Find where it was extracted
-            for path in LIBC_PATHS:
-                full_path = os.path.join(output_dir, path.lstrip('./'))
-                if os.path.exists(full_path):
-                    return full_path
-        else:
-            print(f"Error: {error.decode()}")
-            
+        _, error = cpio.communicate()
+        rpm2cpio.wait()
+
     except FileNotFoundError:
         print("Error: rpm2cpio or cpio not found. Install with:")
         print("sudo apt-get install rpm2cpio cpio")
-    
+        return None
+
+    if cpio.returncode != 0:
+        print(f"Error: {error.decode()}")
+        return None
+
+    # Find where it was extracted. On older releases libc.so.6 is only a symlink
+    # to libc-<version>.so (also extracted above), so resolve it to the real file
+    for path in candidates:
+        full_path = os.path.join(output_dir, path.lstrip('./'))
+        if os.path.isfile(full_path):
+            return os.path.realpath(full_path)
     return None
 
-def extract_all_rpms(quiet=False):
-    # Gets a list of file paths of downloaded files
-    files = download_rpms_all_version(quiet)
-    # Makes a temp place to store binary
-    binary_dir = "../GlibcDownloads/Fedora/Binaries"
-    os.makedirs(binary_dir, exist_ok=True)
-    name_list = []
-    for f in files:
-        result = extract_with_rpm2cpio(f, binary_dir)
-        if result:
-            print(f"Extracted to: {result}")
-            # Ugly line that isolates just the filename, sans path and extention
-            name = os.path.splitext(os.path.basename(f))[0]
-            name_list.append(name + "_libc.so.6")
-            # Could probably remove the if now, but I was having difficulties so I used it for error checking
-            if not copy_binary(result, f"{binary_dir}/{name}_libc.so.6"): 
-                print("Error with copy_binary, quiting")
-        else:
+def extract_libc(rpm_file, binary_dir):
+    """
+    Extract libc.so.6 from one rpm into binary_dir under a name unique to that rpm
+    Args:
+        rpm_file (str): Path to the source rpm archive file
+        binary_dir (str): Path where the renamed binary should be placed
+    Returns:
+        str: filename of the extracted binary (inside binary_dir), or None on failure
+    """
+    # Ugly line that isolates just the filename, sans path and extention
+    name = os.path.splitext(os.path.basename(rpm_file))[0]
+
+    # Every rpm unpacks to the same ./usr/lib64/... style paths, so give each one
+    # its own folder or parallel extractions would overwrite each other
+    extract_dir = os.path.join(binary_dir, name)
+    os.makedirs(extract_dir, exist_ok=True)
+    try:
+        result = extract_with_rpm2cpio(rpm_file, extract_dir)
+        if not result:
+            print(f"Error: could not find libc.so.6 in {rpm_file}")
             print("Extraction failed")
-    return name_list
+            return None
 
-def create_rop_gadgets(quiet=False):
+        # Same filesystem, so this is a rename rather than a copy
+        destination_path = os.path.join(binary_dir, name + "_libc.so.6")
+        os.replace(result, destination_path)
+    finally:
+        shutil.rmtree(extract_dir, ignore_errors=True)
+
+    print(f"Extracted to: {destination_path}")
+    return name + "_libc.so.6"
+
+def gadget_path_for(name, gadgets_dir):
+    """
+    Build the gadget file path for an rpm or extracted binary name
+    Args:
+        name (str): rpm filename (glibc-2.41-11.fc42.x86_64.rpm) or binary name (glibc-2.41-11.fc42.x86_64_libc.so.6)
+        gadgets_dir (str): Path to the Fedora gadgets folder
+    Returns:
+        str: e.g. gadgets_dir/x86_64/glibc_2.41_fc42_x86_64.txt
+    """
+    arch = name.split(".")[3].replace("_libc", "")
+    glibc_version = name.split('-')[1]
+    fedora_version = name.split('.')[2]
+    return os.path.join(gadgets_dir, arch, "glibc_" + glibc_version + "_" + fedora_version + "_" + arch + ".txt")
+
+def run_ropper(name, gadgets_dir, binary_dir):
+    """
+    Run ropper over one extracted libc and write the cleaned gadget list into gadgets_dir
+    Args:
+        name (str): filename of the extracted binary inside binary_dir
+        gadgets_dir (str): Path to the Fedora gadgets folder (an arch subfolder is created)
+        binary_dir (str): Path where the extracted binaries are stored
+    """
+    gadget_path = gadget_path_for(name, gadgets_dir)
     # Make a subfolder for that architecture
-    gadgets_dir = "../Gadgets/Fedora"
-    binary_dir = "../GlibcDownloads/Fedora/Binaries"
-    names = extract_all_rpms(quiet)
-    for name in names:
-        arch = name.split(".")[3].replace("_libc", "")
-        arch_dir = os.path.join(gadgets_dir, arch)
-        os.makedirs(arch_dir, exist_ok=True)
-        glibc_version = name.split('-')[1]
-        fedora_version = name.split('.')[2]
-        gadget_path = os.path.join(arch_dir, "glibc_" + glibc_version + "_" + fedora_version + "_" + arch + ".txt")
-        glibc_path = os.path.join(binary_dir, name)
-        print(f"Running {name} through ropper to {gadget_path}")
-        with open(gadget_path, "w") as out:
-            subprocess.run(
+    os.makedirs(os.path.dirname(gadget_path), exist_ok=True)
+    glibc_path = os.path.join(binary_dir, name)
+    print(f"Running {name} through ropper to {gadget_path}")
+    # Filter the LOAD and INFO lines out as ropper prints them, so the gadget file is
+    # written once and never has to be read back into memory.
+    # Write to a .tmp file and only move it into place once ropper succeeds, so a
+    # half written gadget file is never left behind (later runs skip existing ones)
+    tmp_path = gadget_path + ".tmp"
+    # Binary mode with a 1 MiB buffer, ropper's bytes go straight to the file without
+    # decoding or newline translation and with far fewer write calls
+    try:
+        with open(tmp_path, "wb", buffering=1 << 20) as out:
+            ropper = subprocess.Popen(
                 ["ropper", "--nocolor", "--file", glibc_path],
-                stdout=out,
-                stderr=subprocess.STDOUT,
-                check=True,
-                text=True)
-        # remove first LOAD and INFO lines by copying the file into memory
-        # probably a more efficient way of doing this but this should work
-        # regex for reducing file size
-        pattern = re.compile(r"\[LOAD\]|\[INFO\]", re.IGNORECASE)
-        print(f"Attempting to remove junk from {gadget_path}")
-        with open(gadget_path, "r") as f:
-            lines = f.readlines()
-        with open(gadget_path, "w") as f:
-            for line in lines:
-                if not pattern.search(line):
-                    f.write(line)
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT)
+            with ropper.stdout:
+                out.writelines(line for line in ropper.stdout if not JUNK_LINE_PATTERN.search(line))
+            if ropper.wait() != 0:
+                raise subprocess.CalledProcessError(ropper.returncode, ropper.args)
+        os.replace(tmp_path, gadget_path)
+    except BaseException:
+        # The gadgets tree gets committed with git add --all (hosting_setup/download.sh),
+        # so don't leave the partial .tmp file in it
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+def create_rop_gadgets(quiet=False):
+    urls = fetch_rpm_urls_all_versions(quiet)
+    # Where we are downloading things (taken from Ubuntu script for consistency)
+    download_dir = '../GlibcDownloads/Fedora'
+    # Makes a temp place to store binary
+    binary_dir = "../GlibcDownloads/Fedora/Binaries"
+    gadgets_dir = "../Gadgets/Fedora"
+    os.makedirs(binary_dir, exist_ok=True)
+
+    # Run download -> extract -> ropper as a pipeline: each rpm moves on to the next
+    # stage as soon as it is ready, instead of waiting for every rpm to finish the
+    # current stage. Downloads are network bound, and extraction and ropper both
+    # happen in child processes (rpm2cpio/cpio and ropper), so threads are enough for
+    # every stage (one ropper per core). Each rpm is deleted once it's extracted and
+    # each libc once ropper is done with it, and at most MAX_IN_FLIGHT builds are in
+    # the pipeline at once, so only a handful sit on disk at a time.
+    download_count = 0
+    # future -> (stage, rpm path or binary name). Each build has exactly one future
+    # pending at a time, so len(pending) is the number of builds in flight
+    pending = {}
+
+    def builds_to_make():
+        for url in urls:
+            # Already have gadgets for this build from an earlier run, skip the whole pipeline for it
+            gadget_path = gadget_path_for(os.path.basename(urlparse(url).path), gadgets_dir)
+            if os.path.exists(gadget_path) and os.path.getsize(gadget_path) > 0:
+                if quiet == False:
+                    print(f"Skipping (already exists): {gadget_path}")
+                continue
+            yield url
+
+    remaining_urls = builds_to_make()
+
+    with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as download_executor, \
+         ThreadPoolExecutor(max_workers=os.cpu_count()) as extract_executor, \
+         ThreadPoolExecutor(max_workers=os.cpu_count()) as ropper_executor:
+        executors = (download_executor, extract_executor, ropper_executor)
+        try:
+            while True:
+                # Only start new downloads while there's room in the pipeline
+                while len(pending) < MAX_IN_FLIGHT:
+                    url = next(remaining_urls, None)
+                    if url is None:
+                        break
+                    pending[download_executor.submit(download_rpm, url, download_dir, quiet)] = ("download", url)
+
+                if not pending:
+                    break
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    stage, item = pending.pop(future)
+                    # result() re-raises anything that failed in a worker (e.g. a ropper error)
+                    result = future.result()
+
+                    if stage == "download":
+                        if result:
+                            download_count += 1
+                            pending[extract_executor.submit(extract_libc, result, binary_dir)] = ("extract", result)
+
+                    elif stage == "extract":
+                        # The rpm isn't needed once libc is out of it
+                        os.remove(item)
+                        if result:
+                            # Every name writes to its own gadget file, so no locking is needed
+                            pending[ropper_executor.submit(run_ropper, result, gadgets_dir, binary_dir)] = ("ropper", result)
+
+                    else:
+                        os.remove(os.path.join(binary_dir, item))
+        except BaseException:
+            # Drop everything still queued so the error shows up now, instead of
+            # after the with block has waited for every remaining build
+            for executor in executors:
+                executor.shutdown(wait=False, cancel_futures=True)
+            raise
+
+    print(f"Successfully downloaded {download_count} files")
 
     # Remove /GlibcDownloads (binaries) directory once it's no longer needed
     binary_abs_path = os.path.abspath("../GlibcDownloads")